@@ -31,4 +31,13 @@ NULL_VALUES = {"", "nan"}
 GENERIC_LABELS = {"date", "opening", "closing", "balance"}
 # Maximum number of rows to scan above the first transaction row
 HEADER_SCAN_RANGE = 3
+# Number of rows at the top and at the bottom classified when locating the transaction block
+BLOCK_SCAN_ROWS = 50
 
+# Maximum number of per-row log messages (e.g. skipped rows) emitted per file
+ROW_LOG_LIMIT = 20
+
+# Largest decompressed size (in bytes) accepted for a single archive member
+MAX_ARCHIVE_MEMBER_SIZE = 256 * 1024 * 1024
+# A text file must load into at least this many columns (date, description, amount) to be a statement
+MIN_STATEMENT_COLUMNS = 3
@@ -115,4 +115,14 @@ bank_abbreviations = {
     "EOD",
     "MIN BAL",
     "AMB CHG"
-}
\ No newline at end of file
+}
+
+# Date-like cell shapes recognised by the vectorized transaction block locator.
+# Each pattern must match the whole (stripped) cell; an optional time part is allowed.
+DATE_LIKE_PATTERNS = [
+    r"\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}",                     # 01/03/2024, 1-3-24
+    r"\d{4}[-/.]\d{1,2}[-/.]\d{1,2}",                       # 2024-03-01
+    r"\d{1,2}[-/. ]?[a-z]{3,9}[-/. ,]*\d{2,4}",             # 01-Mar-2024, 1 March 2024
+    r"[a-z]{3,9}[-/. ]\d{1,2}(st|nd|rd|th)?[-/. ,]*\d{2,4}",  # Mar 01, 2024
+]
+DATE_TIME_SUFFIX = r"([ t]\d{1,2}:\d{2}(:\d{2}(\.\d+)?)?( ?[ap]m)?)?"
@@ -1,15 +1,196 @@
-import pandas as pd
+import contextlib
+import gzip
+import io
+import logging
 import os
+import tarfile
+import zipfile
+
+import pandas as pd
+
+from bank_statement_parser.config.constants import MAX_ARCHIVE_MEMBER_SIZE, MIN_STATEMENT_COLUMNS
+from bank_statement_parser.utils.logger import logger
+
+# Number of leading bytes read to identify a file's format
+SNIFF_SIZE = 512
+ZIP_MAGIC = (b"PK\x03\x04", b"PK\x05\x06")
+OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # legacy .xls (Compound File Binary)
+GZIP_MAGIC = b"\x1f\x8b"
+TAR_MAGIC = b"ustar"
+TAR_MAGIC_OFFSET = 257
+ARCHIVE_FORMATS = {"zip", "gzip", "tar"}
+# Rows read by pd.read_csv to decide whether a text file is a CSV statement
+CSV_PREVIEW_ROWS = 50
+# Chunk size used when decompressing archive members
+READ_CHUNK_SIZE = 1024 * 1024
+# Skipped files with these names are reported at WARNING level
+STATEMENT_EXTENSIONS = (".csv", ".xls", ".xlsx")
+
+
+@contextlib.contextmanager
+def _open_binary(source):
+    """Yields a binary file object for a path or an already open buffer (left open)."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield f
+    else:
+        source.seek(0)
+        yield source
+        source.seek(0)
+
+
+def sniff_format(source):
+    """
+    Identifies a statement's format from its leading bytes rather than its extension.
+
+    Args:
+        source (str | BinaryIO): Path to the file or an in-memory binary buffer.
+
+    Returns:
+        str | None: One of 'xlsx', 'xls', 'csv', 'zip', 'gzip', 'tar',
+                    or None if the content is not recognised.
+    """
+    with _open_binary(source) as f:
+        head = f.read(SNIFF_SIZE)
+
+        if head.startswith(ZIP_MAGIC):
+            f.seek(0)
+            with zipfile.ZipFile(f) as archive:
+                names = archive.namelist()
+            # .xlsx workbooks are zip packages too; tell them apart by their content types part
+            if "[Content_Types].xml" in names and any(name.startswith("xl/") for name in names):
+                return "xlsx"
+            return "zip"
+
+    if head.startswith(OLE2_MAGIC):
+        return "xls"
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head[TAR_MAGIC_OFFSET:TAR_MAGIC_OFFSET + len(TAR_MAGIC)] == TAR_MAGIC:
+        return "tar"
+    if _loads_as_csv(source):
+        return "csv"
+    return None
+
+
+def _loads_as_csv(source):
+    """
+    Checks whether `pd.read_csv` can load the first rows of a text file as a statement.
+
+    Files that fail to parse, or that load into fewer than MIN_STATEMENT_COLUMNS
+    columns (such as notes or READMEs), are not treated as CSV.
+    """
+    try:
+        with _open_binary(source) as f:
+            preview = pd.read_csv(f, header=None, nrows=CSV_PREVIEW_ROWS)
+    except Exception:  # pandas raises several parser, decoding and empty-data errors
+        return False
+    return preview.shape[1] >= MIN_STATEMENT_COLUMNS
+
+
+def _read_limited(stream, name):
+    """
+    Reads a decompressed stream into a buffer in chunks, up to MAX_ARCHIVE_MEMBER_SIZE bytes.
+
+    Returns:
+        io.BytesIO | None: The buffer, or None if the stream is larger than the limit.
+    """
+    buffer = io.BytesIO()
+    while chunk := stream.read(READ_CHUNK_SIZE):
+        if buffer.tell() + len(chunk) > MAX_ARCHIVE_MEMBER_SIZE:
+            logger.warning(f"Skipping {name}: larger than {MAX_ARCHIVE_MEMBER_SIZE} bytes once decompressed")
+            return None
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+
+def _iter_tar_members(fileobj, name, mode):
+    """Yields the statements inside a tar archive, reading members one at a time."""
+    with tarfile.open(fileobj=fileobj, mode=mode) as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            member_name = f"{name}/{member.name}"
+            if member.size > MAX_ARCHIVE_MEMBER_SIZE:
+                logger.warning(f"Skipping {member_name}: larger than {MAX_ARCHIVE_MEMBER_SIZE} bytes")
+                continue
+            buffer = _read_limited(archive.extractfile(member), member_name)
+            if buffer is not None:
+                yield from iter_statement_sources(buffer, member_name)
+
+
+def iter_statement_sources(source, name):
+    """
+    Yields every statement contained in a file, unpacking archives in memory.
+
+    Zip, gzip and tar archives (including nested ones such as .tar.gz) are read one
+    member at a time into in-memory buffers without writing to disk. Members larger
+    than MAX_ARCHIVE_MEMBER_SIZE once decompressed are skipped. Each member is yielded
+    as an independent statement; files in an unrecognised format are skipped, with a
+    warning if their name looks like a statement.
+
+    Args:
+        source (str | BinaryIO): Path to the file or an in-memory binary buffer.
+        name (str): Display name of the file, used to name archive members.
+
+    Yields:
+        tuple[str, str | BinaryIO]: (statement name, path or buffer) pairs for `robust_load`.
+    """
+    file_format = sniff_format(source)
+
+    if file_format is None:
+        level = logging.WARNING if name.lower().endswith(STATEMENT_EXTENSIONS) else logging.DEBUG
+        logger.log(level, f"Skipping unsupported file: {name}")
+        return
+
+    if file_format not in ARCHIVE_FORMATS:
+        yield name, source
+        return
+
+    with _open_binary(source) as f:
+        if file_format == "zip":
+            with zipfile.ZipFile(f) as archive:
+                for member in archive.infolist():
+                    if member.is_dir():
+                        continue
+                    member_name = f"{name}/{member.filename}"
+                    if member.file_size > MAX_ARCHIVE_MEMBER_SIZE:
+                        logger.warning(f"Skipping {member_name}: larger than {MAX_ARCHIVE_MEMBER_SIZE} bytes")
+                        continue
+                    with archive.open(member) as member_file:
+                        buffer = _read_limited(member_file, member_name)
+                    if buffer is not None:
+                        yield from iter_statement_sources(buffer, member_name)
+
+        elif file_format == "tar":
+            yield from _iter_tar_members(f, name, "r:")
+
+        else:
+            member_name = name[:-len(".gz")] if name.lower().endswith(".gz") else name
+            with gzip.GzipFile(fileobj=f) as decompressed:
+                head = decompressed.read(SNIFF_SIZE)
+            f.seek(0)
+
+            # Gzip'd tars are streamed member by member instead of being decompressed whole
+            if head[TAR_MAGIC_OFFSET:TAR_MAGIC_OFFSET + len(TAR_MAGIC)] == TAR_MAGIC:
+                yield from _iter_tar_members(f, member_name, "r:gz")
+            else:
+                with gzip.GzipFile(fileobj=f) as decompressed:
+                    buffer = _read_limited(decompressed, member_name)
+                if buffer is not None:
+                    yield from iter_statement_sources(buffer, member_name)
 
 
 def robust_load(input_file):
     """
-    Loads a bank statement file into a DataFrame based on its extension.
+    Loads a bank statement file into a DataFrame based on its content.
 
-    Supports `.xlsx`, `.xls`, and `.csv` formats.
+    Supports `.xlsx`, `.xls`, and `.csv` formats, detected by content sniffing.
+    Archives must first be expanded with `iter_statement_sources`.
 
     Args:
-        input_file (str): Path to the input file.
+        input_file (str | BinaryIO): Path to the input file or an in-memory binary buffer.
 
     Returns:
         pd.DataFrame: Loaded dataframe with no header assumed.
@@ -17,20 +198,19 @@ def robust_load(input_file):
     Raises:
         ValueError: If file format is unsupported or reading fails.
     """
-    _, ext = os.path.splitext(input_file)
-    ext = ext.lower().lstrip('.')  # extract and normalize file extension
+    file_format = sniff_format(input_file)
 
-    if ext == "xlsx":
+    if file_format == "xlsx":
         return pd.read_excel(input_file, engine="openpyxl", header=None)
 
-    elif ext == "xls":
+    elif file_format == "xls":
         try:
             return pd.read_excel(input_file, engine="xlrd", header=None)
         except Exception as e:
             raise ValueError(f"⚠️ Error reading {input_file}: {e}")
 
-    elif ext == "csv":
+    elif file_format == "csv":
         return pd.read_csv(input_file, header=None)
 
     else:
-        raise ValueError(f"Unsupported file type: {ext}")
+        raise ValueError(f"Unsupported file type: {file_format or 'unknown'}")
@@ -1,8 +1,11 @@
 from rapidfuzz import fuzz
 from bank_statement_parser.config.constants import expected_headers, HEADER_SCAN_RANGE
-from bank_statement_parser.core.transaction_validator import TransactionValidator
+from bank_statement_parser.core.transaction_locator import TransactionBlockLocator
 from bank_statement_parser.utils.logger import logger
 
+# Marks that no transaction block was passed, as opposed to None for "no block found"
+_LOCATE_BLOCK = object()
+
 
 class HeaderDetector:
     """
@@ -105,20 +108,25 @@ class HeaderDetector:
         return total_score / category_count if category_count > 0 else 0.0
 
     @staticmethod
-    def find_best_header(df, scan_top_n=50):
+    def find_best_header(df, scan_top_n=50, transaction_block=_LOCATE_BLOCK):
         """
         Finds the best header row using both bottom-up and top-down strategies.
 
         Args:
             df (pd.DataFrame): Raw input DataFrame.
             scan_top_n (int): Number of top rows to scan for top-down strategy.
+            transaction_block (tuple[int, int] | None): (start, end) of the transaction rows,
+                as returned by `TransactionBlockLocator.locate`. Located here if not given;
+                None means no block was found and disables the bottom-up strategy.
 
         Returns:
             int or None: Index of the best header row.
         """
 
         # Try to find the first valid transaction row
-        first_transaction_index = TransactionValidator.find_first_transaction_row(df)
+        if transaction_block is _LOCATE_BLOCK:
+            transaction_block = TransactionBlockLocator.locate(df)
+        first_transaction_index = transaction_block[0] if transaction_block is not None else None
 
         bottom_up_score = -1
         bottom_up_header_index = None
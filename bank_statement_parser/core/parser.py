@@ -1,59 +1,138 @@
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 
 from bank_statement_parser.config.constants import StandardHeader
-from bank_statement_parser.core.file_loader import robust_load
+from bank_statement_parser.core.file_loader import iter_statement_sources, robust_load
 from bank_statement_parser.core.header_detector import HeaderDetector
-from bank_statement_parser.utils.common_utils import get_standard_header_keys, sanitize_numeric_column
-from bank_statement_parser.utils.logger import logger
+from bank_statement_parser.core.transaction_locator import TransactionBlockLocator
+from bank_statement_parser.utils.common_utils import (
+    compact_string_dtype, get_standard_header_keys, sanitize_numeric_column, to_compact_amount, to_compact_date
+)
+from bank_statement_parser.utils.logger import configure_logging, logger, logging_settings
+from bank_statement_parser.utils.quarantine import QuarantineWriter
 from bank_statement_parser.core.transaction_validator import TransactionValidator
 from bank_statement_parser.utils.transforms import mask_all_digits, normalize_date
 
 
 class BankStatementParser:
 
-    def __init__(self, input_dir, output_file):
+    def __init__(self, input_dir, output_file, compact=False, quarantine_file=None, workers=1):
         """
         Initializes the parser with input directory and output file path.
+
+        When `compact` is True, only the mapped columns are kept once the header is
+        detected and the output uses typed columns (string, date and float64)
+        instead of Python objects, which lowers peak memory on large statements.
+
+        When `quarantine_file` is given, rows rejected during validation are written
+        there (CSV, or JSONL for a `.jsonl` path) with their file, row index and reason.
+
+        `workers` sets how many statements (including members of the same archive)
+        are parsed concurrently in separate processes.
         """
         self.input_dir = input_dir
         self.output_file = output_file
+        self.compact = compact
+        self.quarantine = QuarantineWriter(quarantine_file) if quarantine_file else None
+        self.workers = workers
 
     def process(self):
         """
         Orchestrates the entire transaction processing pipeline.
         Parses all supported files in the input directory, extracts and
         validates transactions, normalizes them, and consolidates into a single CSV.
+
+        Zip, gzip and tar archives are expanded in memory and each member is
+        processed as an independent statement as soon as it is read.
         """
-        all_valid_rows = []
         logger.info(f"Scanning directory: {self.input_dir}")
 
+        statements = self.iter_statements()
+        if self.workers > 1:
+            results = self.process_concurrently(statements)
+        else:
+            results = (self.process_statement(file_name, source) for file_name, source in statements)
+
+        all_valid_rows = [processed_df for processed_df in results if processed_df is not None]
+        self.consolidate_and_save(all_valid_rows)
+
+        if self.quarantine is not None:
+            rejected_count = self.quarantine.flush()
+            if rejected_count:
+                logger.info(f"Quarantined {rejected_count} rejected rows into: {self.quarantine.output_file}")
+
+    def iter_statements(self):
+        """
+        Yields (name, source) for every statement in the input directory, one at a time.
+
+        Archive members are decompressed only when they are reached, so at most the
+        statements currently being parsed are held in memory.
+        """
         for file_name in os.listdir(self.input_dir):
             file_path = os.path.join(self.input_dir, file_name)
-            logger.info(f"Processing file: {file_name}")
-
-            if not file_name.endswith(('.xls', '.xlsx', '.csv')):
-                logger.debug(f"Skipping unsupported file: {file_name}")
+            if not os.path.isfile(file_path):
                 continue
 
             try:
-                processed_df = self.process_single_file(file_path, file_name)
-                if processed_df is not None:
-                    all_valid_rows.append(processed_df)
+                yield from iter_statement_sources(file_path, file_name)
             except Exception as e:
-                logger.exception(f"Error processing file {file_name}: {e}")
-            print()  # For readability in logs
+                logger.exception(f"Error reading file {file_name}: {e}")
 
-        self.consolidate_and_save(all_valid_rows)
+    def process_concurrently(self, statements):
+        """
+        Processes statements in worker processes as they are read, yielding results in input order.
+
+        At most twice `workers` statements are in flight, which bounds how many
+        decompressed archive members are held in memory at once. Workers return the
+        rows they rejected, so the quarantine file is still written once by this process.
+        """
+        max_in_flight = 2 * self.workers
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self, logging_settings())) as executor:
+            pending = deque()
+            for file_name, source in statements:
+                pending.append(executor.submit(_process_in_worker, file_name, source))
+                if len(pending) >= max_in_flight:
+                    yield self.collect_worker_result(pending.popleft())
+            while pending:
+                yield self.collect_worker_result(pending.popleft())
+
+    def collect_worker_result(self, future):
+        """Waits for a worker's result and keeps the rows it quarantined."""
+        result, rejected_records = future.result()
+        if self.quarantine is not None:
+            self.quarantine.extend(rejected_records)
+        return result
+
+    def process_statement(self, file_name, source) -> pd.DataFrame | None:
+        """
+        Processes one statement, logging instead of raising on failure.
+
+        Args:
+            file_name (str): The name of the statement (archive members are named `archive/member`).
+            source (str | BinaryIO): Path to the file or an in-memory buffer.
 
-    def process_single_file(self, file_path: str, file_name: str) -> pd.DataFrame | None:
+        Returns:
+            pd.DataFrame | None: Processed transactions, or None if the statement was skipped or failed.
+        """
+        logger.info(f"Processing file: {file_name}")
+        try:
+            return self.process_single_file(source, file_name)
+        except Exception as e:
+            logger.exception(f"Error processing file {file_name}: {e}")
+            return None
+
+    def process_single_file(self, file_path, file_name: str) -> pd.DataFrame | None:
         """
         Processes a single transaction file.
 
         Loads the file, detects headers, validates and normalizes transactions.
 
         Args:
-            file_path (str): The full path to the file.
+            file_path (str | BinaryIO): The full path to the file or an in-memory buffer.
             file_name (str): The name of the file.
 
         Returns:
@@ -66,34 +145,67 @@ class BankStatementParser:
             logger.warning(f"Skipping {file_name}: No data loaded or file is empty.")
             return None
 
-        header_idx = HeaderDetector.find_best_header(df)
+        transaction_block = self.locate_transaction_block(df)
+        logger.debug(f"Transaction block located at rows: {transaction_block}")
+
+        header_idx = HeaderDetector.find_best_header(df, transaction_block=transaction_block)
         if header_idx is None:
             logger.warning(f"Skipping {file_name}: No header detected.")
             return None
 
+        # Validate only up to the last transaction row, leaving footer lines out of the data range
+        # (extended by `extend_data_end` once the columns are mapped)
+        data_end = len(df)
+        if transaction_block is not None and transaction_block[1] > header_idx:
+            data_end = transaction_block[1] + 1
+
         headers = [str(col).strip() for col in df.iloc[header_idx].tolist()]
-        data_df = df.iloc[header_idx + 1:].reset_index(drop=True)
-        data_df.columns = headers
         logger.info(f"Header detected at row {header_idx}: {headers}")
 
-        actual_to_standard = HeaderDetector.match_expected_to_actual(data_df.columns)
+        actual_to_standard = HeaderDetector.match_expected_to_actual(headers)
         logger.info(f"Column mapping: {actual_to_standard}")
 
         if not actual_to_standard:
             logger.warning(f"Skipping {file_name}: Could not map essential columns to standard headers.")
             return None
 
-        valid_transactions_df = TransactionValidator.validate_and_extract_transactions(data_df, actual_to_standard, file_name)
+        data_end = self.extend_data_end(df, data_end, headers, actual_to_standard)
+
+        if self.compact:
+            data_df = self.select_mapped_columns(df, header_idx, headers, actual_to_standard, data_end)
+            del df  # the mapped slice is an independent copy, so the raw frame can be released early
+        else:
+            # Keep the original row labels so rejected rows can be traced back to the file
+            data_df = df.iloc[header_idx + 1:data_end]
+            data_df.columns = headers
+
+        valid_transactions_df = TransactionValidator.validate_and_extract_transactions(
+            data_df, actual_to_standard, file_name, self.quarantine)
         if valid_transactions_df is None or valid_transactions_df.empty:
             logger.warning(f"No valid transactions found in {file_name}")
             return None
 
-        normalized_df = self.normalize_transactions(valid_transactions_df, actual_to_standard)
-        final_df = self.generate_net_amount_coulmn(normalized_df)
+        if self.compact:
+            final_df = self.compact_normalize_transactions(valid_transactions_df, actual_to_standard)
+        else:
+            normalized_df = self.normalize_transactions(valid_transactions_df, actual_to_standard)
+            final_df = self.generate_net_amount_coulmn(normalized_df)
 
         logger.info(f"Processed {file_name}: {len(final_df)} valid rows")
         return final_df
 
+    def locate_transaction_block(self, df: pd.DataFrame) -> tuple[int, int] | None:
+        """
+        Locates the (start, end) row positions of the transaction block in a raw DataFrame.
+
+        Args:
+            df (pd.DataFrame): Raw DataFrame (no headers).
+
+        Returns:
+            tuple[int, int] | None: First and last transaction row positions, or None if not found.
+        """
+        return TransactionBlockLocator.locate(df)
+
     def generate_net_amount_coulmn(self, normalized_df) -> pd.DataFrame:
         """
         Calculates the net amount for each transaction by subtracting the debit value from the credit value.
@@ -151,6 +263,93 @@ class BankStatementParser:
         # Ensure consistent column order
         return partial_df[get_standard_header_keys()]
 
+    @staticmethod
+    def extend_data_end(df: pd.DataFrame, data_end: int, headers: list[str], actual_to_standard: dict) -> int:
+        """
+        Moves the end of the data range past trailing rows that still hold valid transactions.
+
+        The block locator only recognises dates matching DATE_LIKE_PATTERNS, so on statements
+        that use or mix other formats (e.g. "1st Mar 2024") the located block can end early.
+        The rows after it, usually just the footer, are checked with the mapped columns.
+
+        Args:
+            df (pd.DataFrame): Raw DataFrame (no headers).
+            data_end (int): Row position where the located data range stops (exclusive).
+            headers (list[str]): Cleaned values of the header row.
+            actual_to_standard (dict): Mapping of actual column names to standard names.
+
+        Returns:
+            int: Position just after the last valid transaction row, or `data_end` if none follow.
+        """
+        standard_to_position = {std: headers.index(col) for col, std in actual_to_standard.items()}
+        required = [StandardHeader.DATE.value, StandardHeader.DESCRIPTION.value,
+                    StandardHeader.CREDIT.value, StandardHeader.DEBIT.value]
+        if data_end >= len(df) or not all(std in standard_to_position for std in required):
+            return data_end
+
+        tail = df.iloc[data_end:, [standard_to_position[std] for std in required]]
+        for position in range(len(tail) - 1, -1, -1):
+            if TransactionValidator.rejection_reason(*tail.iloc[position]) is None:
+                return data_end + position + 1
+        return data_end
+
+    @staticmethod
+    def select_mapped_columns(df: pd.DataFrame, header_idx: int, headers: list[str],
+                              actual_to_standard: dict, data_end: int | None = None) -> pd.DataFrame:
+        """
+        Slices the data rows below the header, keeping only the columns mapped to standard headers.
+
+        Unmapped columns are dropped before any row-level work, so validation and
+        normalization never copy them.
+
+        Args:
+            df (pd.DataFrame): Raw DataFrame (no headers).
+            header_idx (int): Index of the detected header row.
+            headers (list[str]): Cleaned values of the header row.
+            actual_to_standard (dict): Mapping of actual column names to standard names.
+            data_end (int | None): Row position where the data range stops (exclusive).
+
+        Returns:
+            pd.DataFrame: Data rows with the mapped columns, labelled by their actual header names.
+        """
+        mapped_columns = list(actual_to_standard.keys())
+        positions = [headers.index(col) for col in mapped_columns]
+        data_df = df.iloc[header_idx + 1:data_end, positions]
+        data_df.columns = mapped_columns
+        return data_df
+
+    def compact_normalize_transactions(self, df_to_normalize: pd.DataFrame, actual_to_standard: dict) -> pd.DataFrame:
+        """
+        Compact-mode counterpart of `normalize_transactions` and `generate_net_amount_coulmn`.
+
+        Builds the standard columns directly with fixed-width dtypes: Arrow-backed
+        strings for descriptions, date32 (or datetime64 without pyarrow) for dates
+        and float64 for amounts. Dates that cannot be parsed become missing
+        instead of keeping their original text.
+
+        Args:
+            df_to_normalize (pd.DataFrame): The DataFrame with validated transactions.
+            actual_to_standard (dict): Mapping of actual column names to standard names.
+
+        Returns:
+            pd.DataFrame: The normalized DataFrame with standard headers and net amount.
+        """
+        standard_to_actual = {standard: actual for actual, standard in actual_to_standard.items()}
+        date_col = standard_to_actual[StandardHeader.DATE.value]
+        desc_col = standard_to_actual[StandardHeader.DESCRIPTION.value]
+
+        columns = {
+            StandardHeader.DATE.value: to_compact_date(df_to_normalize[date_col].map(normalize_date)),
+            StandardHeader.DESCRIPTION.value: (
+                df_to_normalize[desc_col].astype(str).map(mask_all_digits).astype(compact_string_dtype())
+            ),
+            StandardHeader.DEBIT.value: to_compact_amount(df_to_normalize[standard_to_actual[StandardHeader.DEBIT.value]]),
+            StandardHeader.CREDIT.value: to_compact_amount(df_to_normalize[standard_to_actual[StandardHeader.CREDIT.value]]),
+        }
+        columns[StandardHeader.AMOUNT.value] = columns[StandardHeader.CREDIT.value] - columns[StandardHeader.DEBIT.value]
+
+        return pd.DataFrame(columns, copy=False)
+
     def consolidate_and_save(self, all_valid_rows: list[pd.DataFrame]):
         """
         Consolidates all processed DataFrames and saves them to a single CSV file.
@@ -167,3 +366,20 @@ class BankStatementParser:
         final_df.to_csv(self.output_file, index=False)
         logger.info(f"Consolidated {len(final_df)} rows into: {self.output_file}")
 
+
+# Parser copy used by the current worker process, set by `_init_worker`
+_worker_parser = None
+
+
+def _init_worker(parser, log_settings):
+    """Sets up a worker process with its own copy of the parser and the parent's logging settings."""
+    global _worker_parser
+    _worker_parser = parser
+    configure_logging(*log_settings)
+
+
+def _process_in_worker(file_name, source):
+    """Processes one statement in a worker process and returns (result, rejected records)."""
+    result = _worker_parser.process_statement(file_name, source)
+    quarantine = _worker_parser.quarantine
+    return result, quarantine.take_records() if quarantine is not None else []
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from bank_statement_parser.config.constants import BLOCK_SCAN_ROWS, NULL_VALUES
+from bank_statement_parser.config.patterns import DATE_LIKE_PATTERNS, DATE_TIME_SUFFIX
+from bank_statement_parser.utils.logger import logger
+
+DATE_LIKE_REGEX = f"(?:{'|'.join(DATE_LIKE_PATTERNS)}){DATE_TIME_SUFFIX}"
+
+
+class TransactionBlockLocator:
+    """
+    Locates the block of transaction rows in a raw statement by cell-type signature.
+
+    Every cell is classified as empty, date-like, numeric or text in one vectorized pass.
+    A row looks like a transaction when it has at least one date-like, one numeric and
+    one text cell; the block spans from the first to the last such row.
+    """
+
+    @staticmethod
+    def classify_cells(df):
+        """
+        Classifies every cell of the DataFrame by type.
+
+        Args:
+            df (pd.DataFrame): Raw DataFrame (no headers).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Boolean (rows x columns) masks
+            for date-like, numeric and text cells.
+        """
+        cells = pd.Series(df.to_numpy(dtype=object).ravel()).astype(str).str.strip().str.lower()
+
+        is_empty = cells.isin(NULL_VALUES)
+        is_date = cells.str.fullmatch(DATE_LIKE_REGEX) & ~is_empty
+        is_numeric = pd.to_numeric(cells, errors="coerce").notna() & ~is_empty & ~is_date
+        is_text = cells.str.contains(r"[a-z]", regex=True) & ~is_date & ~is_numeric
+
+        shape = df.shape
+        return (is_date.to_numpy(dtype=bool).reshape(shape),
+                is_numeric.to_numpy(dtype=bool).reshape(shape),
+                is_text.to_numpy(dtype=bool).reshape(shape))
+
+    @classmethod
+    def transaction_row_mask(cls, df):
+        """Returns a boolean array marking rows whose cells look like a transaction."""
+        if df.empty:
+            return np.zeros(len(df), dtype=bool)
+        is_date, is_numeric, is_text = cls.classify_cells(df)
+        return is_date.any(axis=1) & is_numeric.any(axis=1) & is_text.any(axis=1)
+
+    @classmethod
+    def locate(cls, df, scan_rows=BLOCK_SCAN_ROWS):
+        """
+        Finds the positions of the first and last transaction rows.
+
+        Only the top and bottom `scan_rows` rows are classified; the whole frame is
+        classified if either window holds no transaction row.
+
+        Args:
+            df (pd.DataFrame): Raw DataFrame (no headers).
+            scan_rows (int): Number of rows classified at each end of the frame.
+
+        Returns:
+            tuple[int, int] | None: (start, end) row positions, both inclusive, or None.
+        """
+        row_count = len(df)
+        if row_count > 2 * scan_rows:
+            window = pd.concat([df.iloc[:scan_rows], df.iloc[-scan_rows:]])
+            positions = np.r_[0:scan_rows, row_count - scan_rows:row_count]
+            mask = cls.transaction_row_mask(window)
+            head_hits = np.flatnonzero(mask[:scan_rows])
+            tail_hits = np.flatnonzero(mask[scan_rows:])
+            if head_hits.size and tail_hits.size:
+                return int(positions[head_hits[0]]), int(positions[scan_rows + tail_hits[-1]])
+
+        hits = np.flatnonzero(cls.transaction_row_mask(df))
+        if not hits.size:
+            logger.debug("No transaction block found by cell-type signature")
+            return None
+        return int(hits[0]), int(hits[-1])
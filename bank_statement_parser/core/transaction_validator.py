@@ -5,7 +5,7 @@ import re
 
 from bank_statement_parser.config.constants import NULL_VALUES, GENERIC_LABELS, StandardHeader
 from bank_statement_parser.config.patterns import GENERIC_PATTERNS, bank_abbreviations, noise_patterns
-from bank_statement_parser.utils.logger import logger
+from bank_statement_parser.utils.logger import RowLogSampler, logger
 
 
 class TransactionValidator:
@@ -64,7 +64,12 @@ class TransactionValidator:
 
     @classmethod
     def find_first_transaction_row(cls, df):
-        """Find the first row in the DataFrame that contains a valid transaction."""
+        """
+        Find the first row in the DataFrame that contains a valid transaction.
+
+        Row-by-row reference scan; the parser locates the transaction block with
+        `TransactionBlockLocator.locate` instead.
+        """
         for i, row in df.iterrows():
             if cls.is_valid_transaction_row(row):
                 return i
@@ -96,10 +101,26 @@ class TransactionValidator:
         # Ensure they are not overlapping values
         return len({str(date_val), str(amount_val), str(desc_val)}) == 3
 
+    @classmethod
+    def rejection_reason(cls, date_val, desc_val, credit_val, debit_val):
+        """Return why a transaction's fields are invalid, or None if the transaction is valid."""
+        if not cls.is_valid_date(date_val):
+            return "invalid date"
+        if not cls.is_valid_description(desc_val):
+            return "invalid description"
+        if not (cls.is_valid_amount(credit_val) or cls.is_valid_amount(debit_val)):
+            return "no valid amount"
+        return None
+
     @classmethod
     def validate_and_extract_transactions(cls, data_df: pd.DataFrame, actual_to_standard: dict,
-                                          file_name: str) -> pd.DataFrame | None:
-        """Validates individual transaction rows and extracts valid ones."""
+                                          file_name: str, quarantine=None) -> pd.DataFrame | None:
+        """
+        Validates individual transaction rows and extracts valid ones.
+
+        Rejected rows are recorded in `quarantine` (a QuarantineWriter) when given;
+        otherwise they are logged, rate-limited by a RowLogSampler.
+        """
         try:
             date_col = [col for col, std in actual_to_standard.items() if std == StandardHeader.DATE.value][0]
             desc_col = [col for col, std in actual_to_standard.items() if std == StandardHeader.DESCRIPTION.value][0]
@@ -109,25 +130,28 @@ class TransactionValidator:
             logger.error(f"Missing essential columns for validation in {file_name}.")
             return None
 
-        valid_rows_list = []
-        for _, row in data_df.iterrows():
-            date_val = row[date_col]
-            desc_val = row[desc_col]
-            credit_val = row[credit_col]
-            debit_val = row[debit_col]
-
-            # Validate individual fields. If any primary validation fails, skip or break.
-            # Using 'and' for all checks means all must pass for a row to be considered valid
-            if (TransactionValidator.is_valid_date(date_val) and
-                    TransactionValidator.is_valid_description(desc_val) and
-                    (TransactionValidator.is_valid_amount(credit_val) or TransactionValidator.is_valid_amount(
-                        debit_val))):
-                valid_rows_list.append(row)
-            else:
-                logger.debug(
-                    f"Skipping invalid row in {file_name}: Date: {date_val}, Desc: {desc_val}, Credit: {credit_val}, Debit: {debit_val}")
-
-        if not valid_rows_list:
+        # Collect a boolean mask instead of row Series so the valid rows are selected in a single take
+        valid_mask = []
+        sampler = RowLogSampler()
+        for row_index, date_val, desc_val, credit_val, debit_val in zip(
+                data_df.index, data_df[date_col], data_df[desc_col], data_df[credit_col], data_df[debit_col]):
+
+            # All checks must pass for a row to be considered valid
+            reason = cls.rejection_reason(date_val, desc_val, credit_val, debit_val)
+            valid_mask.append(reason is None)
+            if reason is None:
+                continue
+
+            # Rejected rows go to the quarantine file when one is configured, not to the log stream
+            if quarantine is not None:
+                quarantine.add(file_name, row_index, reason, date_val, desc_val, credit_val, debit_val)
+            elif sampler.should_log():
+                logger.debug("Skipping invalid row %s in %s (%s): Date: %s, Desc: %s, Credit: %s, Debit: %s",
+                             row_index, file_name, reason, date_val, desc_val, credit_val, debit_val)
+
+        sampler.summary(file_name)
+
+        if not any(valid_mask):
             return None
 
-        return pd.DataFrame(valid_rows_list, columns=data_df.columns)
+        return data_df.loc[valid_mask]
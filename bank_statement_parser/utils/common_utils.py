@@ -1,6 +1,26 @@
 from bank_statement_parser.config.constants import StandardHeader
+from bank_statement_parser.utils.logger import logger
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is in requirements.txt; without it compact mode falls back to numpy-backed dtypes
+    pa = None
+
+_warned_without_pyarrow = False
+
+
+def _warn_without_pyarrow():
+    """Logs once that compact mode is running without pyarrow."""
+    global _warned_without_pyarrow
+    if not _warned_without_pyarrow:
+        logger.warning("pyarrow is not installed: compact mode uses pandas string and datetime64 columns "
+                       "instead of Arrow strings and date32")
+        _warned_without_pyarrow = True
+
+
 def get_standard_header_keys():
     """
     Returns a list of all standard header keys as strings.
@@ -16,3 +36,49 @@ def sanitize_numeric_column(series: pd.Series) -> pd.Series:
     and infers the appropriate numeric dtype.
     """
     return series.replace(['', ' ', None, pd.NA], 0).fillna(0).infer_objects()
+
+
+def compact_string_dtype():
+    """
+    Returns the string dtype used for text columns in compact mode.
+    Arrow-backed strings when pyarrow is installed, pandas' own string dtype otherwise.
+    """
+    if pa is None:
+        _warn_without_pyarrow()
+        return "string"
+    return "string[pyarrow]"
+
+
+def to_compact_date(series: pd.Series) -> pd.Series:
+    """
+    Converts a Series of normalized 'YYYY-MM-DD' strings to a fixed-width date column.
+    Uses Arrow date32 when pyarrow is installed, datetime64[s] otherwise.
+    Values that are not normalized dates become missing. Both keep any four-digit
+    year, unlike datetime64[ns], which stops at 2262.
+    """
+    if pa is not None:
+        timestamps = pc.strptime(pa.array(series.astype(str), type=pa.string()),
+                                 format="%Y-%m-%d", unit="s", error_is_null=True)
+        return pd.Series(pd.arrays.ArrowExtensionArray(timestamps.cast(pa.date32())), index=series.index)
+
+    _warn_without_pyarrow()
+    text = series.astype(str)
+    is_iso = text.str.fullmatch(r"\d{4}-\d{2}-\d{2}").to_numpy(dtype=bool)
+    days = np.full(len(series), np.datetime64("NaT"), dtype="datetime64[D]")
+    try:
+        days[is_iso] = text[is_iso].to_numpy(dtype=str).astype("datetime64[D]")
+    except ValueError:
+        # An impossible date such as 2024-13-45 is present; convert cell by cell
+        for i in np.flatnonzero(is_iso):
+            try:
+                days[i] = np.datetime64(text.iat[i], "D")
+            except ValueError:
+                pass
+    return pd.Series(days.astype("datetime64[s]"), index=series.index)
+
+
+def to_compact_amount(series: pd.Series) -> pd.Series:
+    """
+    Converts an amount column to float64, treating empty, null and whitespace values as 0.
+    """
+    return series.infer_objects(copy=False).replace(['', ' ', None], pd.NA).fillna(0).astype("float64")
@@ -1,5 +1,10 @@
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from bank_statement_parser.config.constants import ROW_LOG_LIMIT
 
 # Create a custom logger
 logger = logging.getLogger("BankStatementParser")
@@ -16,3 +21,92 @@ console_handler.setFormatter(formatter)
 # Add handlers to the logger
 if not logger.hasHandlers():
     logger.addHandler(console_handler)
+
+# Background writer used when asynchronous logging is enabled
+_listener = None
+_row_log_limit = ROW_LOG_LIMIT
+
+
+def configure_logging(level="DEBUG", use_queue=False, row_log_limit=None):
+    """
+    Configures the level and output mode of the parser logger.
+
+    Args:
+        level (str | int): Logging level name (e.g. 'INFO') or number.
+        use_queue (bool): If True, records are put on a queue by a `QueueHandler`
+                          and written to the console by a background `QueueListener`,
+                          so the parsing thread never blocks on console I/O.
+        row_log_limit (int | None): Maximum number of per-row messages logged per file.
+                                    Keeps the current limit when None.
+    """
+    global _listener, _row_log_limit
+
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    logger.setLevel(level)
+    console_handler.setLevel(level)
+
+    if row_log_limit is not None:
+        _row_log_limit = row_log_limit
+
+    stop_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    if use_queue:
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        logger.addHandler(QueueHandler(log_queue))
+        _listener.start()
+    else:
+        logger.addHandler(console_handler)
+
+
+def stop_logging():
+    """Stops the background writer, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def logging_settings():
+    """
+    Returns the current (level, use_queue, row_log_limit) settings.
+    Worker processes pass them to `configure_logging` to log like the parent.
+    """
+    return logger.level, _listener is not None, _row_log_limit
+
+
+class RowLogSampler:
+    """
+    Rate-limits per-row log messages for a single file.
+
+    This is a hard cap: the first `limit` messages are logged and the rest are
+    suppressed. `summary()` reports how many were suppressed.
+    """
+
+    def __init__(self, limit=None):
+        self.limit = _row_log_limit if limit is None else limit
+        self.count = 0
+        self.suppressed = 0
+
+    def should_log(self, level=logging.DEBUG):
+        """Counts one message and returns whether it should be emitted."""
+        if not logger.isEnabledFor(level):
+            return False
+
+        self.count += 1
+        if self.count <= self.limit:
+            return True
+
+        self.suppressed += 1
+        return False
+
+    def summary(self, file_name, level=logging.DEBUG):
+        """Logs how many per-row messages were suppressed for the file, if any."""
+        if self.suppressed:
+            logger.log(level, "Suppressed %d further row messages in %s", self.suppressed, file_name)
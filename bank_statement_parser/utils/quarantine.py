@@ -0,0 +1,93 @@
+import csv
+import json
+import os
+import threading
+
+import pandas as pd
+
+from bank_statement_parser.utils.transforms import mask_all_digits
+
+
+class QuarantineWriter:
+    """
+    Collects rows rejected during validation and writes them to a structured file in bulk.
+
+    The output format follows the file extension: `.jsonl` writes one JSON object per line,
+    anything else is written as CSV. Descriptions are masked like the parsed output, and
+    missing cells are written as empty values (`null` in JSONL).
+
+    `row_index` is the 0-based index of the row in the loaded DataFrame. It is not a source
+    line number: blank lines in CSV files are dropped when loading and are not counted.
+    """
+
+    FIELDS = ["file", "row_index", "reason", "date", "description", "credit", "debit"]
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks cannot be pickled; worker processes get an empty writer and a fresh lock
+        return {"output_file": self.output_file}
+
+    def __setstate__(self, state):
+        self.__init__(state["output_file"])
+
+    def add(self, file_name, row_index, reason, date=None, description=None, credit=None, debit=None):
+        """Records a rejected row; nothing is written until `flush` is called."""
+        record = {
+            "file": file_name,
+            "row_index": row_index,
+            "reason": reason,
+            "date": _cell_text(date),
+            "description": _cell_text(description, mask_all_digits),
+            "credit": _cell_text(credit),
+            "debit": _cell_text(debit),
+        }
+        with self._lock:
+            self.records.append(record)
+
+    def extend(self, records):
+        """Adds records collected by another writer, such as one in a worker process."""
+        with self._lock:
+            self.records.extend(records)
+
+    def take_records(self):
+        """Returns the collected records and clears them without writing anything."""
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+    def flush(self):
+        """
+        Writes all collected records to the quarantine file and clears them.
+        Nothing is written if no rows were rejected.
+
+        Returns:
+            int: Number of records written.
+        """
+        records = self.take_records()
+        if not records:
+            return 0
+
+        output_dir = os.path.dirname(self.output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        with open(self.output_file, "w", newline="", encoding="utf-8") as f:
+            if self.output_file.lower().endswith(".jsonl"):
+                f.writelines(json.dumps(record) + "\n" for record in records)
+            else:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                writer.writeheader()
+                writer.writerows(records)
+
+        return len(records)
+
+
+def _cell_text(value, transform=str):
+    """Returns a raw cell as text, or None if the cell is missing."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return transform(value)
@@ -3,6 +3,8 @@ import pandas as pd
 import datetime
 from dateutil.parser import parse
 
+from bank_statement_parser.utils.logger import logger
+
 
 def mask_all_digits(text):
     """
@@ -38,7 +40,7 @@ def normalize_date(value):
     try:
         return parse(str(value), fuzzy=True).strftime("%Y-%m-%d")
     except Exception:
-        print(f"⚠️ Failed to parse date from: {value}")
+        logger.debug("Failed to parse date from: %s", value)
         return value  # Return original if parsing fails
 
 
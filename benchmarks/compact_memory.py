@@ -0,0 +1,114 @@
+"""
+Measures peak memory of the default and compact parsing modes on a large synthetic statement.
+
+Usage:
+    python benchmarks/compact_memory.py --rows 100000
+
+Each mode runs in its own subprocess so the peaks do not influence each other.
+"""
+import argparse
+import csv
+import logging
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_statement_parser.core.parser import BankStatementParser  # noqa: E402
+from bank_statement_parser.utils.logger import logger  # noqa: E402
+
+DESCRIPTIONS = [
+    "POS {ref} Swiggy Bangalore", "NEFT to LIC Premium {ref}", "UPI/{ref}/Grocery Store",
+    "Salary from ACME Corp", "ATM CASHWDL {ref} MG Road", "IMPS {ref} Rent Transfer",
+]
+
+
+def write_synthetic_statement(path, rows, seed=0):
+    """Writes a statement with a preamble, extra unmapped columns and a footer."""
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["---- Statement for March 2024 ----", "", "", "", "", "", ""])
+        writer.writerow(["Generated on: 01-Apr-2024", "", "", "", "", "", ""])
+        writer.writerow(["", "", "", "", "", "", ""])
+        writer.writerow(["Txn Date", "Narration", "Chq/Ref No", "Value Dt", "Withdrawal Amt", "Deposit Amt",
+                         "Closing Balance"])
+        balance = 100000.0
+        for i in range(rows):
+            day = f"{i % 28 + 1:02d}/03/2024"
+            ref = str(rng.randrange(10 ** 9, 10 ** 10))
+            amount = round(rng.uniform(10, 5000), 2)
+            is_debit = rng.random() < 0.7
+            balance += -amount if is_debit else amount
+            writer.writerow([
+                day, rng.choice(DESCRIPTIONS).format(ref=ref), ref, day,
+                f"{amount:.2f}" if is_debit else "", "" if is_debit else f"{amount:.2f}", f"{balance:.2f}",
+            ])
+        writer.writerow(["Total Balance:", "", "", "", "", "", f"{balance:.2f}"])
+        writer.writerow(["Note: This is a computer-generated statement", "", "", "", "", "", ""])
+
+
+def measure(mode, file_path):
+    """Parses one file in the given mode and prints its peak memory figures."""
+    logger.setLevel(logging.WARNING)
+    parser = BankStatementParser(os.path.dirname(file_path), os.devnull, compact=(mode == "compact"))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = parser.process_single_file(file_path, os.path.basename(file_path))
+    elapsed = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    arrow_peak = 0
+    try:
+        import pyarrow as pa
+        arrow_peak = pa.default_memory_pool().max_memory()
+    except ImportError:
+        pass
+
+    # ru_maxrss is reported in kilobytes on Linux
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    result_size = int(result.memory_usage(deep=True).sum()) if result is not None else 0
+    print(f"{traced_peak + arrow_peak},{rss_peak},{result_size},{elapsed:.2f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--rows", type=int, default=100000, help="Number of synthetic transactions")
+    arg_parser.add_argument("--measure", nargs=2, metavar=("MODE", "FILE"), help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "synthetic_statement.csv")
+        write_synthetic_statement(file_path, args.rows)
+        print(f"Synthetic statement: {args.rows} rows, {os.path.getsize(file_path) / 2 ** 20:.1f} MiB")
+
+        results = {}
+        for mode in ("default", "compact"):
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--measure", mode, file_path],
+                check=True, capture_output=True, text=True,
+            ).stdout.strip().splitlines()[-1]
+            results[mode] = [float(value) for value in output.split(",")]
+
+    print(f"{'mode':<10}{'peak alloc MiB':>16}{'peak RSS MiB':>14}{'result MiB':>12}{'seconds':>10}")
+    for mode, (traced, rss, size, elapsed) in results.items():
+        print(f"{mode:<10}{traced / 2 ** 20:>16.1f}{rss / 2 ** 20:>14.1f}{size / 2 ** 20:>12.1f}{elapsed:>10.2f}")
+
+    default_peak, compact_peak = results["default"][0], results["compact"][0]
+    print(f"Peak allocation reduction: {(1 - compact_peak / default_peak) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
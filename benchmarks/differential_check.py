@@ -0,0 +1,310 @@
+"""
+Differential check of optimized parsing modes against the reference pipeline.
+
+Usage:
+    python benchmarks/differential_check.py --statements 40 --rows 200 --seed 0 --report diff_report.json
+
+Generates randomized statements (preambles, alias headers, date formats, including
+formats outside the block locator's date patterns and statements mixing formats row by
+row, footer noise and junk rows), parses each with the reference pipeline, which
+reproduces the original row-by-row scan, iterrows validator and normalization, and with
+every mode in MODES,
+and reports row-level differences of the output CSV together with timing ratios.
+The parallel mode is compared on the consolidated output of the whole directory.
+Exits with status 1 if any mode's output differs from the reference.
+"""
+import argparse
+import csv
+import datetime
+import difflib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bank_statement_parser.config.constants import StandardHeader, expected_headers  # noqa: E402
+from bank_statement_parser.core.file_loader import robust_load  # noqa: E402
+from bank_statement_parser.core.header_detector import HeaderDetector  # noqa: E402
+from bank_statement_parser.core.parser import BankStatementParser  # noqa: E402
+from bank_statement_parser.core.transaction_validator import TransactionValidator  # noqa: E402
+from bank_statement_parser.utils.logger import configure_logging  # noqa: E402
+
+DATE_FORMATS = ["%d-%b-%Y", "%d/%m/%Y", "%Y-%m-%d", "%b %d, %Y", "%d %B %Y", "%d.%m.%y"]
+# Formats that DATE_LIKE_PATTERNS does not match; "%o" is the ordinal day (1st, 2nd, ...)
+UNPATTERNED_DATE_FORMATS = ["%o %b %Y", "%a, %d %b %Y", "%A %d %B %Y", "%a %b %o %Y"]
+# Share of statements whose rows each use a randomly chosen format
+MIXED_FORMAT_SHARE = 0.3
+DESCRIPTIONS = [
+    "POS {ref} Swiggy Bangalore", "NEFT to LIC Premium {ref}", "UPI/{ref}/Grocery Store",
+    "Salary from ACME Corp", "ATM CASHWDL {ref} MG Road", "IMPS {ref} Rent Transfer",
+    "CHQ NO. {ref} Clearing", "Interest credited", "AMB CHG for Mar",
+]
+PREAMBLE_LINES = [
+    "---- Statement for March 2024 ----", "Statement of Account", "Account Number: XXXXXX1234",
+    "Customer Name: A Kumar", "Statement Period: 01/03/2024 to 31/03/2024", "Branch Name: MG Road",
+    "Generated on: 01-Apr-2024", "",
+]
+FOOTER_LINES = [
+    ["Total Balance:", "", "{amount}"], ["Closing Balance", "{amount}"], ["Opening Balance", "{amount}"],
+    ["Note: This is a computer-generated statement"], ["Page 1 of 1"], [""],
+]
+EXTRA_COLUMNS = ["Chq/Ref No", "Balance", "Branch Code"]
+
+
+class ReferenceParser(BankStatementParser):
+    """
+    Parser reproducing the original pipeline, which optimized modes are compared against.
+
+    The first transaction row is found by the row-by-row scan, every row below the header
+    is validated with `iterrows`, and the valid rows are re-indexed and normalized with
+    `normalize_transactions`.
+    """
+
+    def process_single_file(self, file_path, file_name):
+        df = robust_load(file_path)
+        if df is None or df.empty:
+            return None
+
+        first_transaction_index = TransactionValidator.find_first_transaction_row(df)
+        transaction_block = None if first_transaction_index is None else (first_transaction_index, len(df) - 1)
+        header_idx = HeaderDetector.find_best_header(df, transaction_block=transaction_block)
+        if header_idx is None:
+            return None
+
+        headers = [str(col).strip() for col in df.iloc[header_idx].tolist()]
+        data_df = df.iloc[header_idx + 1:].reset_index(drop=True)
+        data_df.columns = headers
+
+        actual_to_standard = HeaderDetector.match_expected_to_actual(data_df.columns)
+        if not actual_to_standard:
+            return None
+
+        valid_transactions_df = reference_validate(data_df, actual_to_standard)
+        if valid_transactions_df is None or valid_transactions_df.empty:
+            return None
+
+        normalized_df = self.normalize_transactions(valid_transactions_df, actual_to_standard)
+        return self.generate_net_amount_coulmn(normalized_df)
+
+
+def reference_validate(data_df, actual_to_standard):
+    """The original row-by-row validator: keeps rows with a date, a description and an amount."""
+    standard_to_actual = {std: col for col, std in actual_to_standard.items()}
+    try:
+        date_col, desc_col, credit_col, debit_col = (
+            standard_to_actual[header.value] for header in
+            (StandardHeader.DATE, StandardHeader.DESCRIPTION, StandardHeader.CREDIT, StandardHeader.DEBIT))
+    except KeyError:
+        return None
+
+    valid_rows_list = []
+    for _, row in data_df.iterrows():
+        if (TransactionValidator.is_valid_date(row[date_col]) and
+                TransactionValidator.is_valid_description(row[desc_col]) and
+                (TransactionValidator.is_valid_amount(row[credit_col]) or
+                 TransactionValidator.is_valid_amount(row[debit_col]))):
+            valid_rows_list.append(row)
+
+    if not valid_rows_list:
+        return None
+    return pd.DataFrame(valid_rows_list, columns=data_df.columns)
+
+
+# Per-statement modes compared against the reference; register new engines here
+MODES = {
+    "default": lambda tmp_dir: BankStatementParser(tmp_dir, os.devnull),
+    "compact": lambda tmp_dir: BankStatementParser(tmp_dir, os.devnull, compact=True),
+}
+
+
+def format_date(date, date_format):
+    """Formats a date with strftime, expanding "%o" to the ordinal day of the month."""
+    day = date.day
+    suffix = "th" if 11 <= day <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+    return date.strftime(date_format.replace("%o", f"{day}{suffix}"))
+
+
+def generate_statement(rng, rows):
+    """Generates one randomized statement as a list of CSV rows."""
+    all_formats = DATE_FORMATS + UNPATTERNED_DATE_FORMATS
+    mixed_formats = rng.random() < MIXED_FORMAT_SHARE
+    date_format = rng.choice(all_formats)
+    columns = {
+        StandardHeader.DATE: rng.choice(expected_headers[StandardHeader.DATE]).title(),
+        StandardHeader.DESCRIPTION: rng.choice(expected_headers[StandardHeader.DESCRIPTION]).title(),
+        StandardHeader.DEBIT: rng.choice(expected_headers[StandardHeader.DEBIT]).title(),
+        StandardHeader.CREDIT: rng.choice(expected_headers[StandardHeader.CREDIT]).title(),
+    }
+    header = list(columns.values()) + rng.sample(EXTRA_COLUMNS, rng.randint(0, len(EXTRA_COLUMNS)))
+    rng.shuffle(header)
+    width = len(header)
+
+    def pad(cells):
+        return (cells + [""] * width)[:width]
+
+    lines = [pad([line]) for line in rng.sample(PREAMBLE_LINES, rng.randint(0, len(PREAMBLE_LINES)))]
+    lines.append(header)
+
+    for i in range(rows):
+        amount = f"{rng.uniform(1, 20000):.2f}"
+        is_debit = rng.random() < 0.6
+        values = {
+            columns[StandardHeader.DATE]: format_date(datetime.date(2024, 3, i % 28 + 1),
+                                                      rng.choice(all_formats) if mixed_formats else date_format),
+            columns[StandardHeader.DESCRIPTION]: rng.choice(DESCRIPTIONS).format(
+                ref=rng.randrange(10 ** (rng.randint(3, 11)))),
+            columns[StandardHeader.DEBIT]: amount if is_debit else "",
+            columns[StandardHeader.CREDIT]: "" if is_debit else amount,
+        }
+        row = [values.get(col, str(rng.randrange(10 ** 6))) for col in header]
+
+        noise = rng.random()
+        if noise < 0.03:
+            row = pad([])  # blank line inside the block
+        elif noise < 0.05:
+            row = pad(["Opening Balance", "", amount])
+        elif noise < 0.07:
+            row = [f"  {cell} " if cell else cell for cell in row]  # stray whitespace
+        elif noise < 0.08:
+            row = [values.get(col, "") if col != columns[StandardHeader.DEBIT] else "" for col in header]
+            row[header.index(columns[StandardHeader.CREDIT])] = ""  # no amount at all
+        lines.append(row)
+
+    for footer in rng.sample(FOOTER_LINES, rng.randint(0, len(FOOTER_LINES))):
+        lines.append(pad([cell.format(amount=f"{rng.uniform(1, 10 ** 6):.2f}") for cell in footer]))
+    return lines
+
+
+def output_rows(frame):
+    """Canonical form of a parser result: its CSV lines, as written to the output file."""
+    return [] if frame is None else frame.to_csv(index=False).splitlines()
+
+
+def diff_rows(reference_rows, candidate_rows):
+    """Returns the row-level differences between two outputs as a list of hunks."""
+    matcher = difflib.SequenceMatcher(a=reference_rows, b=candidate_rows, autojunk=False)
+    return [
+        {"op": tag, "reference_rows": [i1, i2], "candidate_rows": [j1, j2],
+         "reference": reference_rows[i1:i2], "candidate": candidate_rows[j1:j2]}
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"
+    ]
+
+
+def parse_timed(parser, file_path):
+    """Parses one statement and returns (output rows, elapsed seconds)."""
+    start = time.perf_counter()
+    try:
+        rows = output_rows(parser.process_single_file(file_path, os.path.basename(file_path)))
+    except Exception as e:
+        rows = [f"<error: {type(e).__name__}: {e}>"]
+    return rows, time.perf_counter() - start
+
+
+def compare_modes(file_paths, tmp_dir, max_examples):
+    """Compares every mode in MODES with the reference parser, statement by statement."""
+    reference = ReferenceParser(tmp_dir, os.devnull)
+    parsers = {name: make_parser(tmp_dir) for name, make_parser in MODES.items()}
+    results = {name: {"statements_differing": 0, "rows_differing": 0, "seconds": 0.0, "examples": []}
+               for name in parsers}
+    reference_seconds = 0.0
+
+    for file_path in file_paths:
+        reference_rows, elapsed = parse_timed(reference, file_path)
+        reference_seconds += elapsed
+
+        for name, parser in parsers.items():
+            rows, elapsed = parse_timed(parser, file_path)
+            result = results[name]
+            result["seconds"] += elapsed
+
+            hunks = diff_rows(reference_rows, rows)
+            if hunks:
+                result["statements_differing"] += 1
+                result["rows_differing"] += sum(max(len(h["reference"]), len(h["candidate"])) for h in hunks)
+                if len(result["examples"]) < max_examples:
+                    result["examples"].append({"file": os.path.basename(file_path), "hunks": hunks[:3]})
+
+    for result in results.values():
+        result["time_ratio"] = result["seconds"] / reference_seconds if reference_seconds else None
+    return reference_seconds, results
+
+
+def compare_parallel(input_dir, tmp_dir, workers, max_examples):
+    """Compares the consolidated output of a concurrent run with a sequential reference run."""
+    outputs = {}
+    seconds = {}
+    for name, parser_class, kwargs in [("reference", ReferenceParser, {}),
+                                       ("parallel", BankStatementParser, {"workers": workers})]:
+        output_file = os.path.join(tmp_dir, f"{name}.csv")
+        start = time.perf_counter()
+        parser_class(input_dir, output_file, **kwargs).process()
+        seconds[name] = time.perf_counter() - start
+        with open(output_file) if os.path.exists(output_file) else open(os.devnull) as f:
+            outputs[name] = f.read().splitlines()
+
+    hunks = diff_rows(outputs["reference"], outputs["parallel"])
+    return {
+        "workers": workers,
+        "rows_differing": sum(max(len(h["reference"]), len(h["candidate"])) for h in hunks),
+        "seconds": seconds["parallel"],
+        "reference_seconds": seconds["reference"],
+        "time_ratio": seconds["parallel"] / seconds["reference"] if seconds["reference"] else None,
+        "examples": hunks[:max_examples],
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--statements", type=int, default=40, help="Number of generated statements")
+    arg_parser.add_argument("--rows", type=int, default=200, help="Transactions per statement")
+    arg_parser.add_argument("--seed", type=int, default=0, help="Random seed for statement generation")
+    arg_parser.add_argument("--workers", type=int, default=4, help="Workers for the parallel mode")
+    arg_parser.add_argument("--max_examples", type=int, default=5, help="Differing statements shown per mode")
+    arg_parser.add_argument("--report", default=None, help="Also write the full report to this JSON file")
+    args = arg_parser.parse_args()
+
+    configure_logging("CRITICAL")
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_dir = os.path.join(tmp_dir, "statements")
+        os.makedirs(input_dir)
+        file_paths = []
+        for i in range(args.statements):
+            file_path = os.path.join(input_dir, f"statement_{i:03d}.csv")
+            with open(file_path, "w", newline="") as f:
+                csv.writer(f).writerows(generate_statement(rng, args.rows))
+            file_paths.append(file_path)
+
+        reference_seconds, results = compare_modes(file_paths, tmp_dir, args.max_examples)
+        results["parallel"] = compare_parallel(input_dir, tmp_dir, args.workers, args.max_examples)
+
+    report = {"statements": args.statements, "rows": args.rows, "seed": args.seed,
+              "reference_seconds": reference_seconds, "modes": results}
+
+    print(f"{args.statements} statements x {args.rows} rows, seed {args.seed}; "
+          f"reference took {reference_seconds:.2f}s")
+    print(f"{'mode':<10}{'stmts differing':>16}{'rows differing':>16}{'seconds':>10}{'time ratio':>12}")
+    for name, result in results.items():
+        time_ratio = "-" if result["time_ratio"] is None else f"{result['time_ratio']:.2f}"
+        print(f"{name:<10}{result.get('statements_differing', '-'):>16}{result['rows_differing']:>16}"
+              f"{result['seconds']:>10.2f}{time_ratio:>12}")
+    for name, result in results.items():
+        for example in result["examples"]:
+            print(f"\n[{name}] {json.dumps(example, indent=2)}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+
+    sys.exit(1 if any(result["rows_differing"] for result in results.values()) else 0)
+
+
+if __name__ == "__main__":
+    main()
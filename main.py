@@ -2,6 +2,7 @@ import argparse
 import os
 import sys
 from bank_statement_parser.core.parser import BankStatementParser
+from bank_statement_parser.utils.logger import configure_logging
 
 def ask_username_gui():
     try:
@@ -18,11 +19,13 @@ def ask_username_gui():
         print("⚠️ GUI not available or input canceled. Falling back to terminal input.")
         return input("Enter your name: ")
 
-def run_parser(input_dir: str, user_name: str):
+def run_parser(input_dir: str, user_name: str, compact: bool = False, quarantine_file: str | None = None,
+               workers: int = 1):
     output_file = os.path.join("output", f"user_{user_name}_parsed.csv")
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-    parser = BankStatementParser(input_dir, output_file)
+    parser = BankStatementParser(input_dir, output_file, compact=compact, quarantine_file=quarantine_file,
+                                 workers=workers)
     parser.process()
 
     print(f"✅ Parsed output saved to: {output_file}")
@@ -34,8 +37,21 @@ if __name__ == "__main__":
         arg_parser = argparse.ArgumentParser(description="Bank Statement Parser")
         arg_parser.add_argument("--user_name", required=True, help="Your name or ID to tag your parsed file")
         arg_parser.add_argument("--input_dir", default="bank_statements", help="Path to your bank statements folder")
+        arg_parser.add_argument("--compact", action="store_true",
+                                help="Keep only mapped columns and use typed columns to reduce memory usage")
+        arg_parser.add_argument("--log_level", default="DEBUG", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                                help="Minimum level of log messages to print")
+        arg_parser.add_argument("--async_logging", action="store_true",
+                                help="Write log messages from a background thread instead of the parsing thread")
+        arg_parser.add_argument("--row_log_limit", type=int, default=None,
+                                help="Maximum number of skipped-row messages logged per file")
+        arg_parser.add_argument("--quarantine_file", default=None,
+                                help="Write rejected rows to this CSV or .jsonl file")
+        arg_parser.add_argument("--workers", type=int, default=1,
+                                help="Number of worker processes parsing statements (including archive members) concurrently")
         args = arg_parser.parse_args()
-        run_parser(args.input_dir, args.user_name)
+        configure_logging(args.log_level, args.async_logging, args.row_log_limit)
+        run_parser(args.input_dir, args.user_name, args.compact, args.quarantine_file, args.workers)
     else:
         print("⚠️ No CLI args detected. Prompting for user name...")
         user_name = ask_username_gui()